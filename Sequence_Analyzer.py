@@ -10,16 +10,27 @@ This script provides a graphical user interface (GUI) for analyzing FASTA files.
 The script supports two types of FASTA entries:
 1. Entries with metadata in brackets (e.g., gene, protein information).
 2. Entries without metadata (assumed to be complete genomes).
+The entry type is detected from the first header and applied to the whole file.
 
 Functions:
     calcular_gc(secuencia):
         Calculate the GC content of a DNA sequence.
 
+    calcular_gc_lote(secuencias):
+        Calculate the GC content of several DNA sequences in batches.
+
+    composicion_bases(secuencia):
+        Count the A, C, G and T bases of a DNA sequence in a single pass.
+
     leer_archivo_fasta(archivo):
         Parse a FASTA file, extracting gene or organism data and their GC content.
 
+    leer_archivo_fasta_cache(archivo):
+        Same as leer_archivo_fasta, but reuses the result for files that have not changed
+        and raises errors instead of showing them (safe to call from a worker thread).
+
     cargar_archivo():
-        Open a dialog to load a FASTA file and process its contents.
+        Open a dialog to load a FASTA file and process its contents in a background thread.
 
     exportar_a_txt():
         Export the processed gene or organism data to a TXT file.
@@ -32,24 +43,458 @@ Usage:
     Run the script to open the GUI. Use the buttons to load a FASTA file and process it.
 """
 
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+import threading
 import tkinter as tk
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from tkinter import filedialog, messagebox
 
 
+# Tamaño máximo (en bytes) de los datos que procesa cada operación en C (translate, find, popcount).
+# Estas operaciones retienen el GIL; trocearlas deja que la interfaz gráfica responda mientras se lee un archivo
+_BLOQUE = 8 << 20
+
+# Caracteres de espacio en blanco que se eliminan de las líneas de secuencia
+_ESPACIOS = b" \t\r\n\v\f"
+
+# Expresión regular para extraer los pares [clave=valor] de los encabezados con corchetes.
+# El valor admite un nivel de corchetes anidados, p. ej. [protein=Superoxide dismutase [Mn], mitochondrial]
+KV_RE = re.compile(r"\[([^=\[\]]+)=((?:[^\[\]]|\[[^\[\]]*\])*)\]")
+
+# Bases que cuentan como GC: G, C y el código IUPAC S (G o C), en mayúscula o minúscula
+_BASES_GC = b"GCSgcs"
+
+# Tabla de traducción de 256 entradas: base GC ---> bit 1, cualquier otro byte (A, T, N, ...) ---> 0
+_GC_BITS = bytes(1 if b in _BASES_GC else 0 for b in range(256))
+
+# Tabla de traducción one-hot: A ---> bit 0, C ---> bit 1, G ---> bit 2, T ---> bit 3 (en mayúscula o minúscula)
+_BASES = "ACGT"
+_UNO_CALIENTE = bytes(1 << _BASES.index(chr(b).upper()) if chr(b).upper() in _BASES else 0 for b in range(256))
+
+# int.bit_count() (popcount nativo) existe desde Python 3.10
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:
+    def _popcount(n):
+        return bin(n).count("1")
+
+
+# Función que cuenta los bits a 1 de un buffer de bytes 0/1 (traducido con _GC_BITS)
+def _contar_bits(bits):
+    return _popcount(int.from_bytes(bits, "little"))
+
+
+# Si Numba está instalado (opcional), el conteo de GC se compila a código nativo vectorizado.
+# El kernel es secuencial (sin prange): se llama desde hilos y procesos de trabajo, donde la capa de
+# hilos de Numba puede no ser segura; nogil=True libera el GIL para que la interfaz siga respondiendo.
+# No se usa cache=True: el script se carga como __main__, __mp_main__ o Sequence_Analyzer y la caché
+# en disco de un nombre falla al recargarse con otro (compilar cuesta ~0.3 s la primera vez)
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    _contar_gc_numba = None
+else:
+    _GC_TABLA = np.frombuffer(_GC_BITS, dtype=np.uint8)
+
+    @njit(nogil=True)
+    def _gc_kernel(codigos, tabla):
+        conteo = 0
+        for i in range(codigos.shape[0]):
+            conteo += tabla[codigos[i]]
+        return conteo
+
+    def _contar_gc_numba(codigos):
+        """Count the GC bases of a uint8 array of ASCII codes."""
+        return int(_gc_kernel(codigos, _GC_TABLA))
+
+
 # Función para calcular el contenido de GC
 def calcular_gc(secuencia):
     """Calculate the GC content of a DNA sequence.
 
     Args:
-        secuencia (str): A string representing the DNA sequence.
+        secuencia (str | bytes): The DNA sequence, as text or as ASCII bytes.
 
     Returns:
         float: The GC content as a percentage of the total sequence length.
     """
-    gc_content = (secuencia.count("G") + secuencia.count("C")) / len(secuencia) * 100
+    buf = secuencia.encode("ascii") if isinstance(secuencia, str) else secuencia
+    gc_content = 100.0 * _contar_gc(buf) / len(buf)
     return gc_content
 
 
+# Función que cuenta las bases GC de una secuencia, en bloques de _BLOQUE bytes
+def _contar_gc(buf):
+    """Count the GC bases of a sequence of ASCII bytes, processing at most _BLOQUE bytes per C call."""
+    conteo_gc = 0
+    for inicio in range(0, len(buf), _BLOQUE):
+        bloque = buf[inicio:inicio + _BLOQUE]
+        if _contar_gc_numba is not None:
+            conteo_gc += _contar_gc_numba(np.frombuffer(bloque, dtype=np.uint8))
+        else:
+            conteo_gc += _contar_bits(bloque.translate(_GC_BITS))
+    return conteo_gc
+
+
+# Función que cuenta las bases GC de varias secuencias cortas con una sola traducción de su concatenación
+def _contar_gc_juntas(secuencias):
+    """Count the GC bases of each sequence in a single pass over their concatenation."""
+    datos = b"".join(secuencias)
+    if _contar_gc_numba is not None:
+        vista = np.frombuffer(datos, dtype=np.uint8)
+        contar = _contar_gc_numba
+    else:
+        vista = memoryview(datos.translate(_GC_BITS))
+        contar = _contar_bits
+
+    conteos = []
+    inicio = 0
+    for secuencia in secuencias:
+        fin = inicio + len(secuencia)
+        conteos.append(contar(vista[inicio:fin]))
+        inicio = fin
+    return conteos
+
+
+# Función para calcular el contenido de GC de varias secuencias a la vez
+def calcular_gc_lote(secuencias):
+    """Calculate the GC content of several DNA sequences, counting short ones together in batches.
+
+    Args:
+        secuencias (list[bytes]): The DNA sequences, as ASCII bytes.
+
+    Returns:
+        list[float]: The GC content of each sequence as a percentage (0 for empty sequences).
+    """
+    # Las secuencias cortas se agrupan hasta sumar _BLOQUE bytes y se cuentan juntas;
+    # las largas se cuentan por separado, en bloques
+    conteos = []
+    grupo = []
+    tamano = 0
+    for secuencia in secuencias:
+        if len(secuencia) >= _BLOQUE:
+            conteos.extend(_contar_gc_juntas(grupo))
+            grupo = []
+            tamano = 0
+            conteos.append(_contar_gc(secuencia))
+            continue
+
+        grupo.append(secuencia)
+        tamano += len(secuencia)
+        if tamano >= _BLOQUE:
+            conteos.extend(_contar_gc_juntas(grupo))
+            grupo = []
+            tamano = 0
+    conteos.extend(_contar_gc_juntas(grupo))
+
+    return [100.0 * conteo / len(secuencia) if secuencia else 0 for conteo, secuencia in zip(conteos, secuencias)]
+
+
+# Función para contar las bases A, C, G y T de una secuencia
+def composicion_bases(secuencia):
+    """Count the A, C, G and T bases of a DNA sequence (case-insensitive) in a single pass.
+
+    Each base is translated to a one-hot bit within its byte and each block of _BLOQUE bytes
+    is read as one integer; the count of each base is the popcount of its bit position.
+
+    Args:
+        secuencia (str | bytes): The DNA sequence, as text or as ASCII bytes.
+
+    Returns:
+        dict[str, int]: The number of "A", "C", "G" and "T" bases. Other symbols are not counted.
+    """
+    buf = secuencia.encode("ascii") if isinstance(secuencia, str) else secuencia
+    conteos = dict.fromkeys(_BASES, 0)
+    unos = None
+    # Se procesa por bloques para limitar la memoria usada (y el tiempo que se retiene el GIL)
+    for inicio in range(0, len(buf), _BLOQUE):
+        bloque = buf[inicio:inicio + _BLOQUE].translate(_UNO_CALIENTE)
+        if unos is None or len(bloque) != _BLOQUE:
+            unos = int.from_bytes(b"\x01" * len(bloque), "little")  # bit 0 de cada byte
+        codigos = int.from_bytes(bloque, "little")
+        for bit, base in enumerate(_BASES):
+            conteos[base] += _popcount((codigos >> bit) & unos)
+    return conteos
+
+
+# Tamaño de archivo (en bytes) a partir del cual el cálculo de GC se reparte entre varios procesos
+_UMBRAL_PARALELO = 16 << 20
+
+# Tamaño aproximado (en bytes) de cada lote de secuencias enviado a un proceso
+_TAMANO_LOTE = 8 << 20
+
+# Grupo de procesos compartido por todas las lecturas (se crea la primera vez que hace falta)
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+# ProcessPoolExecutor solo acepta mp_context (necesario para usar "spawn") desde Python 3.7;
+# en versiones anteriores el cálculo de GC se hace siempre en el propio proceso
+_POOL_DISPONIBLE = sys.version_info >= (3, 7)
+
+
+# Función que devuelve los núcleos que este proceso puede usar (respeta la afinidad y los límites del contenedor)
+def _num_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Función que devuelve el grupo de procesos compartido, creándolo si aún no existe
+def _obtener_pool():
+    """Return the shared process pool used for large files, creating it on first use.
+
+    Workers are started with "spawn": the pool is created from a worker thread of a
+    process that has Tcl/Tk loaded, where fork() is unsafe.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=_num_cpus(),
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _POOL
+
+
+# Función que descarta el grupo de procesos compartido si se ha roto (p. ej. un proceso murió por falta de memoria)
+def _reiniciar_pool(pool):
+    """Drop a broken shared process pool so that the next large file creates a new one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:  # Otro hilo puede haberlo reemplazado ya
+            _POOL = None
+    pool.shutdown(wait=False)
+
+
+# Función que procesa un encabezado con corchetes (tipo 1: genes con anotaciones)
+def _procesar_encabezado_gen(linea):
+    """Extract gene data from a FASTA header with bracketed metadata.
+
+    Args:
+        linea (str): The stripped header line, including the leading ">".
+
+    Returns:
+        tuple[str, str]: The gene name (or locus tag) and the protein functionality.
+    """
+    campos = dict(KV_RE.findall(linea))
+    nombre_gen = campos.get("gene", campos.get("locus_tag", "Desconocido"))
+    funcionalidad_proteina = campos.get("protein", "Desconocida")
+
+    return nombre_gen, funcionalidad_proteina
+
+
+# Función que procesa un encabezado sin corchetes (tipo 2: genoma completo)
+def _procesar_encabezado_organismo(linea):
+    """Extract organism data from a FASTA header without metadata.
+
+    Args:
+        linea (str): The stripped header line, including the leading ">".
+
+    Returns:
+        tuple[str, str]: The organism name and "genoma completo".
+    """
+    partes = linea.split(" ")
+    nombre_organismo = " ".join(partes[1:3])  # Extract full organism name
+    return nombre_organismo, "genoma completo"
+
+
+# Función que busca el primero de varios patrones en el archivo proyectado en memoria, en ventanas de _BLOQUE bytes
+def _buscar(mm, patrones, inicio, limite=None):
+    """Return the first position of any of patrones in mm[inicio:limite] (-1 if absent).
+
+    Each call to mmap.find scans at most _BLOQUE bytes. Patterns after the first are only
+    searched up to the best match so far, so the most frequent pattern should come first.
+    """
+    limite = len(mm) if limite is None else limite
+    while inicio < limite:
+        fin = min(inicio + _BLOQUE, limite)
+        posicion = -1
+        for patron in patrones:
+            # Solo interesa una coincidencia que empiece antes del fin de la ventana o de la mejor ya encontrada
+            hasta = fin if posicion == -1 else posicion
+            encontrado = mm.find(patron, inicio, min(hasta + len(patron) - 1, limite))
+            if encontrado != -1:
+                posicion = encontrado
+        if posicion != -1:
+            return posicion
+        inicio = fin
+    return -1
+
+
+# Función que detecta el fin de línea del archivo: "\n" (Unix/Windows) o "\r" solo (Mac clásico)
+def _terminadores(mm):
+    """Return the line terminators to look for, the one used by the file first."""
+    if mm.find(b"\n", 0, _BLOQUE) == -1 and mm.find(b"\r", 0, _BLOQUE) != -1:
+        return b"\r", b"\n"
+    return b"\n", b"\r"
+
+
+# Función que recorre los registros del archivo proyectado en memoria
+def _registros(mm, encabezados):
+    """Yield the (start, end) offsets of the sequence of each record of a memory-mapped FASTA file.
+
+    The decoded header of each record is appended to encabezados before its offsets are yielded.
+    Any text before the first header is ignored.
+    """
+    # Como en modo texto, tanto "\n" como "\r" terminan una línea
+    terminadores = _terminadores(mm)
+    separadores = tuple(terminador + b">" for terminador in terminadores)
+
+    # Se ignora cualquier texto previo al primer encabezado
+    if mm[:1] == b">":
+        inicio = 0
+    else:
+        inicio = _buscar(mm, separadores, 0)
+        inicio = inicio + 1 if inicio != -1 else -1
+
+    while inicio != -1:
+        fin = _buscar(mm, separadores, inicio)
+        fin_registro = fin if fin != -1 else len(mm)
+        fin_encabezado = _buscar(mm, terminadores, inicio, fin_registro)
+        if fin_encabezado == -1:
+            fin_encabezado = fin_registro
+
+        # Solo el encabezado se decodifica a str; la secuencia se queda en el archivo.
+        # Los bytes que no son UTF-8 válido (p. ej. Latin-1) se reemplazan en lugar de abortar la lectura
+        encabezados.append(mm[inicio:fin_encabezado].strip().decode("utf-8", errors="replace"))
+        yield fin_encabezado + 1, fin_registro
+
+        inicio = fin + 1 if fin != -1 else -1
+
+
+# Función que calcula el contenido de GC de cada registro a medida que se recorre el archivo
+def _calcular_gc_registros(mm, registros, paralelo):
+    """Calculate the GC content of every sequence of a memory-mapped FASTA file while it is scanned.
+
+    Short sequences are copied without whitespace into batches of about _TAMANO_LOTE bytes, and
+    each batch is processed by calcular_gc_lote as soon as it is full (in the shared process pool
+    if paralelo is true), so only its results are kept. Sequences of _BLOQUE bytes or more are
+    counted straight from the file, one block at a time. Memory use is bounded by a few batches
+    instead of growing with the size of the file. If the pool breaks (e.g. a worker is killed),
+    it is discarded and the affected batches are processed in this process instead.
+
+    Args:
+        mm (mmap.mmap): The memory-mapped FASTA file.
+        registros (Iterable[tuple[int, int]]): The (start, end) offsets of each sequence in mm.
+        paralelo (bool): Whether the batches are processed in the shared process pool.
+
+    Returns:
+        list[float]: The GC content of each sequence as a percentage, in the same order.
+    """
+    partes = []  # Resultados de cada lote, en orden: lista de porcentajes o futuro del grupo de procesos
+    en_vuelo = deque()  # (posición en partes, lote) de los lotes enviados al grupo que aún no se han esperado
+    pool = _obtener_pool() if paralelo else None
+    lote = []
+    tamano_lote = 0
+
+    def romper_pool():
+        nonlocal pool
+        if pool is not None:
+            _reiniciar_pool(pool)
+            pool = None  # El resto de lotes de este archivo se procesan aquí
+
+    def esperar_lote():
+        posicion, lote_enviado = en_vuelo.popleft()
+        try:
+            partes[posicion] = partes[posicion].result()
+        except BrokenProcessPool:
+            romper_pool()
+            partes[posicion] = calcular_gc_lote(lote_enviado)
+
+    def procesar_lote():
+        nonlocal lote, tamano_lote
+        if not lote:
+            return
+        try:
+            if pool is None:
+                partes.append(calcular_gc_lote(lote))
+            else:
+                partes.append(pool.submit(calcular_gc_lote, lote))
+                en_vuelo.append((len(partes) - 1, lote))
+        except BrokenProcessPool:
+            romper_pool()
+            partes.append(calcular_gc_lote(lote))
+        # Como mucho dos lotes por núcleo pendientes: se espera al más antiguo y se libera su lote
+        if len(en_vuelo) > 2 * _num_cpus():
+            esperar_lote()
+        lote = []
+        tamano_lote = 0
+
+    for inicio, fin in registros:
+        if fin - inicio < _BLOQUE:
+            secuencia = mm[inicio:fin].translate(None, _ESPACIOS)
+            lote.append(secuencia)
+            tamano_lote += len(secuencia)
+            if tamano_lote >= _TAMANO_LOTE:
+                procesar_lote()
+            continue
+
+        # Secuencia larga: se cuenta bloque a bloque desde el archivo, sin copiarla entera
+        procesar_lote()
+        conteo_gc = 0
+        longitud = 0
+        for i in range(inicio, fin, _BLOQUE):
+            bloque = mm[i:min(i + _BLOQUE, fin)].translate(None, _ESPACIOS)
+            conteo_gc += _contar_gc(bloque)
+            longitud += len(bloque)
+        partes.append([100.0 * conteo_gc / longitud if longitud else 0])
+    procesar_lote()
+
+    while en_vuelo:
+        esperar_lote()
+    return [gc for parte in partes for gc in parte]
+
+
+# Función que lee el archivo FASTA y extrae la información (lanza una excepción si el archivo no se puede leer)
+def _parsear_fasta(archivo):
+    """Parse a FASTA file and extract gene or organism data and their GC content.
+
+    Large files (at least _UMBRAL_PARALELO bytes) are processed in the shared process pool
+    when more than one core is available (Python 3.7 or later).
+
+    Args:
+        archivo (str): The path to the FASTA file.
+
+    Returns:
+        tuple[list[str], array.array, list[str]]: See leer_archivo_fasta.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    encabezados = []
+    with open(archivo, "rb") as file:
+        tamano = os.fstat(file.fileno()).st_size
+        if tamano == 0:
+            return [], array("d"), []
+
+        # El archivo se proyecta en memoria y se recorre como bytes, sin decodificar las secuencias
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            paralelo = _POOL_DISPONIBLE and tamano >= _UMBRAL_PARALELO and _num_cpus() >= 2
+            contenidos_gc = _calcular_gc_registros(mm, _registros(mm, encabezados), paralelo)
+
+    # El tipo de encabezado se detecta una sola vez, con el primero: con corchetes ---> tipo 1, sin ellos ---> tipo 2
+    if encabezados and "[" in encabezados[0]:
+        procesar_encabezado = _procesar_encabezado_gen
+    else:
+        procesar_encabezado = _procesar_encabezado_organismo
+
+    # Los resultados se guardan en columnas paralelas (una lista o arreglo por campo)
+    nombres = []
+    funcionalidades = []
+    for encabezado in encabezados:
+        nombre_gen, funcionalidad_proteina = procesar_encabezado(encabezado)
+        nombres.append(nombre_gen)
+        funcionalidades.append(funcionalidad_proteina)
+
+    return nombres, array("d", contenidos_gc), funcionalidades
+
+
 # Función para leer el archivo FASTA, procesar las líneas y extraer la información
 def leer_archivo_fasta(archivo):
     """Read a FASTA file to extract gene/s and calculate GC content.
@@ -58,144 +503,156 @@ def leer_archivo_fasta(archivo):
         archivo (str): The path to the FASTA file.
 
     Returns:
-        list[dict]: A list of dictionaries containing information about genes or organisms:
-            - "Gen": Name of the gene or organism if the file has complete genoma.
-            - "Contenido GC": GC content as a percentage.
-            - "Funcionalidad Proteína": Description or type (e.g., "proteína" or "genoma completo").
+        tuple[list[str], array.array, list[str]]: Three parallel columns, one entry per gene or organism:
+            - Name of the gene, or of the organism if the file has complete genoma.
+            - GC content of each sequence as a percentage (array of doubles).
+            - Protein functionality or type (e.g., the protein name or "genoma completo").
     """
-    genes = []
     try:
-        with open(archivo, "r") as file:
-            lineas = file.readlines()
-
-        i = 0
-        while i < len(lineas):
-            linea = lineas[i].strip()
-
-            if "[" not in linea:  #Si no tiene corchetes ---> tipo 2
-                tipo_entrada = "organismo"
-                tipo_info = "genoma completo"
-            else:  # si tiene corchetes ---> tipo 1
-                tipo_entrada = "gen"
-                tipo_info = "proteína"
-
-            if linea.startswith(">"):
-                if tipo_entrada == "gen":
-                    partes = linea.split("[")
-                    nombre_gen = "Desconocido"
-                    funcionalidad_proteina = "Desconocida"
-
-                    for gn in partes:
-                        if "gene=" in gn:
-                            nombre_gen = gn.split("gene=")[-1].split("]")[0]
-                        elif "locus_tag=" in gn and nombre_gen == "Desconocido":
-                            nombre_gen = gn.split("locus_tag=")[-1].split("]")[0]
-                        elif "protein=" in gn:
-                            funcionalidad_proteina = gn.split("protein=")[-1].split("]")[0]
-
-                    secuencia = ""
-                    i += 1
-                    while i < len(lineas) and not lineas[i].startswith(">"):
-                        secuencia += lineas[i].strip()
-                        i += 1
-
-                    #Se caclula el contenido GC
-                    gc_content = calcular_gc(secuencia) if secuencia else 0
-
-                    #Agregamos información en fomrato dict a la lista
-                    genes.append({
-                        "Gen": nombre_gen,
-                        "Contenido GC": round(gc_content, 2),
-                        "Funcionalidad Proteína": funcionalidad_proteina
-                    })
-
-                # Type 2 entry (without brackets)
-                elif tipo_entrada == "organismo":
-                    partes = linea.split(" ")
-                    nombre_organismo = " ".join(partes[1:3])  # Extract full organism name
-
-                    # Extract associated sequence
-                    secuencia = ""
-                    i += 1
-                    while i < len(lineas) and not lineas[i].startswith(">"):
-                        secuencia += lineas[i].strip()
-                        i += 1
-
-                    # calcular contenido GC
-                    gc_content = calcular_gc(secuencia) if secuencia else 0
-
-                    #Se agrega el diccionario obtenido a la lista
-                    genes.append({
-                        "Gen": nombre_organismo,
-                        "Contenido GC": round(gc_content, 2),
-                        "Funcionalidad Proteína": tipo_info
-                    })
+        return _parsear_fasta(archivo)
+    except Exception as e:
+        messagebox.showerror("Error", f"Error al leer el archivo: {e}")
+        return [], array("d"), []
 
-            else:
-                i += 1
 
+# Caché de archivos ya procesados: ruta absoluta ---> (fecha de modificación, tamaño, genes).
+# Guarda como máximo _MAX_CACHE archivos; se descarta el usado hace más tiempo.
+# _CACHE_LOCK protege la caché, que se usa desde varios hilos de lectura a la vez
+_cache_fasta = {}
+_MAX_CACHE = 8
+_CACHE_LOCK = threading.Lock()
+
+
+# Función que evita volver a procesar un archivo que no ha cambiado desde la última lectura
+def leer_archivo_fasta_cache(archivo):
+    """Parse a FASTA file, reusing the previous result if the file is unchanged.
+
+    Only the latest version of each file is kept (at most _MAX_CACHE files), and empty results
+    are not cached. Unlike leer_archivo_fasta, errors are raised instead of shown in a dialog,
+    so this function can run outside the Tkinter main thread.
+
+    Args:
+        archivo (str): The path to the FASTA file.
+
+    Returns:
+        tuple[list[str], array.array, list[str]]: The same columns returned by leer_archivo_fasta.
+    """
+    info = os.stat(archivo)
+    ruta = os.path.abspath(archivo)
+    with _CACHE_LOCK:
+        entrada = _cache_fasta.get(ruta)
+        if entrada is not None and entrada[:2] == (info.st_mtime_ns, info.st_size):
+            _cache_fasta[ruta] = _cache_fasta.pop(ruta)  # Pasa a ser el usado más recientemente
+            return entrada[2]
+
+    # Archivo nuevo o modificado: se procesa fuera del candado para no bloquear otras lecturas
+    genes = _parsear_fasta(archivo)
+    if not genes[0]:  # No se guardan lecturas vacías
         return genes
 
-    except Exception as e:
-        messagebox.showerror("Error", f"Error al leer el archivo: {e}")
-        return []
+    with _CACHE_LOCK:
+        _cache_fasta.pop(ruta, None)  # La entrada anterior (si la hay) se reemplaza
+        _cache_fasta[ruta] = (info.st_mtime_ns, info.st_size, genes)
+        while len(_cache_fasta) > _MAX_CACHE:
+            del _cache_fasta[next(iter(_cache_fasta))]
+    return genes
+
+
+# Hilos para leer archivos sin bloquear la interfaz gráfica
+_EXEC = ThreadPoolExecutor(max_workers=2)
+
 
+#Formato del encabezado y de cada fila de la tabla de resultados (ventana y archivo exportado).
+#El contenido GC se guarda sin redondear y solo se muestra con 2 decimales
+_HEADER_FMT = "{:<20} {:<15} {:<50}\n"
+_ROW_FMT = "{:<20} {:<15.2f} {:<50}\n"
 
-#Creamos la ventana principal
-ventana = tk.Tk()
-ventana.title("Análisis de Genes")
+#Variables para almacenar los genes, como columnas paralelas
+nombres_global = []
+gc_global = array("d")
+funcionalidades_global = []
 
-#Variable para almacenar los genes
-genes_global = []
+#Genes de cada archivo cargado (ruta absoluta ---> genes), para no duplicarlos al recargar un archivo
+genes_por_archivo = {}
 
 
 #Función que nos abre una ventana para seleccionar el archivo de nuestro interés
 def cargar_archivo():
-    """Open a file dialog to load a FASTA file and display extracted gene or organism data."""
+    """Open a file dialog to load a FASTA file and parse it in a background thread."""
     archivo = filedialog.askopenfilename(filetypes=[("Archivos FASTA o TXT", "*.fasta *.txt")])
     if archivo:
-        genes = leer_archivo_fasta(archivo)
-        if genes:
-            genes_global.extend(genes)
+        futuro = _EXEC.submit(leer_archivo_fasta_cache, archivo)
+        _esperar_lectura(archivo, futuro)
 
-            ventana_emergente = tk.Toplevel(ventana)
-            ventana_emergente.title("Información de Genes")
 
-            text_box = tk.Text(ventana_emergente)
-            text_box.pack(pady=100,padx=100)
+#Función que revisa periódicamente si terminó la lectura del archivo, sin bloquear la ventana
+def _esperar_lectura(archivo, futuro):
+    """Poll a background FASTA read and display its result once it is done.
 
-            encabezado = "{:<20} {:<15} {:<50}\n".format("Gen", "Contenido GC (%)", "Funcionalidad Proteína")
-            separador = "-" * 75 + "\n"
-            text_box.insert(tk.END, encabezado)
-            text_box.insert(tk.END, separador)
+    Args:
+        archivo (str): The path to the FASTA file being read.
+        futuro (concurrent.futures.Future): The pending result of leer_archivo_fasta_cache.
+    """
+    if not futuro.done():
+        ventana.after(50, _esperar_lectura, archivo, futuro)
+        return
 
-            for gen in genes:
-                fila = "{:<20} {:<15} {:<50}\n".format(gen["Gen"], gen["Contenido GC"], gen["Funcionalidad Proteína"])
-                text_box.insert(tk.END, fila)
-        else:
-            messagebox.showwarning("Advertencia", "No se encontraron genes válidos en el archivo.")
+    try:
+        genes = futuro.result()
+    except Exception as e:
+        messagebox.showerror("Error", f"Error al leer el archivo: {e}")
+        return
 
+    _mostrar_genes(archivo, genes)
 
-# Crear un botón para cargar el archivo FASTA
-cargar_button = tk.Button(ventana, text="Cargar Archivo FASTA", command=cargar_archivo)
-cargar_button.pack(pady=10, padx=100, ipadx=80)
+
+#Función que muestra los genes de un archivo en una ventana emergente
+def _mostrar_genes(archivo, genes):
+    """Store the genes of a loaded file and display them in a new window.
+
+    Args:
+        archivo (str): The path to the FASTA file.
+        genes (tuple[list[str], array.array, list[str]]): The columns returned by leer_archivo_fasta.
+    """
+    nombres, contenidos_gc, funcionalidades = genes
+    if nombres:
+        genes_por_archivo[os.path.abspath(archivo)] = genes
+        del nombres_global[:], gc_global[:], funcionalidades_global[:]
+        for nombres_archivo, gc_archivo, funcionalidades_archivo in genes_por_archivo.values():
+            nombres_global.extend(nombres_archivo)
+            gc_global.extend(gc_archivo)
+            funcionalidades_global.extend(funcionalidades_archivo)
+
+        ventana_emergente = tk.Toplevel(ventana)
+        ventana_emergente.title("Información de Genes")
+
+        text_box = tk.Text(ventana_emergente)
+        text_box.pack(pady=100,padx=100)
+
+        encabezado = _HEADER_FMT.format("Gen", "Contenido GC (%)", "Funcionalidad Proteína")
+        separador = "-" * 75 + "\n"
+        filas = [encabezado, separador]
+        filas.extend(map(_ROW_FMT.format, nombres, contenidos_gc, funcionalidades))
+
+        # Se inserta todo el texto de una sola vez (una única llamada a Tcl)
+        text_box.insert(tk.END, "".join(filas))
+    else:
+        messagebox.showwarning("Advertencia", "No se encontraron genes válidos en el archivo.")
 
 
 # Función para exportar los resultados a un archivo de texto
 def exportar_a_txt():
     """Export the processed gene or organism data to a TXT file."""
-    if genes_global:
+    if nombres_global:
         archivo = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Archivos de Texto", "*.txt")])
         if archivo:
             try:
+                encabezado = _HEADER_FMT.format("Gen", "Contenido GC (%)", "Funcionalidad Proteína")
+                filas = [encabezado, "-" * 85 + "\n"]
+                filas.extend(map(_ROW_FMT.format, nombres_global, gc_global, funcionalidades_global))
+
                 with open(archivo, "w") as f:
-                    encabezado = "{:<20} {:<15} {:<50}\n".format("Gen", "Contenido GC (%)", "Funcionalidad Proteína")
-                    f.write(encabezado)
-                    f.write("-" * 85 + "\n")
-                    for gen in genes_global:
-                        fila = "{:<20} {:<15} {:<50}\n".format(gen["Gen"], gen["Contenido GC"],
-                                                               gen["Funcionalidad Proteína"])
-                        f.write(fila)
+                    f.write("".join(filas))
                 messagebox.showinfo("Éxito", f"Archivo guardado en: {archivo}")
             except Exception as e:
                 messagebox.showerror("Error", f"No se pudo guardar el archivo: {e}")
@@ -205,10 +662,20 @@ def exportar_a_txt():
         messagebox.showwarning("Advertencia", "No hay datos para exportar.")
 
 
-# Crear un botón para exportar a TXT
-exportar_button = tk.Button(ventana, text="Exportar a TXT", command=exportar_a_txt)
-exportar_button.pack(pady=40,ipady=10)
+# La interfaz solo se construye al ejecutar el script (no al importarlo desde los procesos de cálculo)
+if __name__ == "__main__":
+    #Creamos la ventana principal
+    ventana = tk.Tk()
+    ventana.title("Análisis de Genes")
+
+    # Crear un botón para cargar el archivo FASTA
+    cargar_button = tk.Button(ventana, text="Cargar Archivo FASTA", command=cargar_archivo)
+    cargar_button.pack(pady=10, padx=100, ipadx=80)
+
+    # Crear un botón para exportar a TXT
+    exportar_button = tk.Button(ventana, text="Exportar a TXT", command=exportar_a_txt)
+    exportar_button.pack(pady=40,ipady=10)
 
-# Ejecutar la interfaz
-ventana.mainloop()
+    # Ejecutar la interfaz
+    ventana.mainloop()
 
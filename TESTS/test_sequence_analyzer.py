@@ -0,0 +1,209 @@
+"""Tests for the sequence analysis functions of Sequence_Analyzer.
+
+Run from the repository root with:
+    python -m unittest discover -s TESTS
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from array import array
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+DIRECTORIO_TESTS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORIO_TESTS))
+
+import Sequence_Analyzer as sa  # noqa: E402
+
+
+class ParsearFastaTest(unittest.TestCase):
+
+    ARCHIVOS = ["test_genoma completo.fasta", "test_multiples genes.txt", "test_nucleotidos desconocidos.fasta"]
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _parsear_bytes(self, contenido):
+        ruta = os.path.join(self.directorio.name, "prueba.fasta")
+        with open(ruta, "wb") as f:
+            f.write(contenido)
+        return sa._parsear_fasta(ruta)
+
+    def _parsear_muestra(self, nombre):
+        return sa._parsear_fasta(os.path.join(DIRECTORIO_TESTS, nombre))
+
+    def test_multiples_genes(self):
+        nombres, contenidos_gc, funcionalidades = self._parsear_muestra("test_multiples genes.txt")
+        self.assertEqual(len(nombres), 804)
+        self.assertEqual(len(contenidos_gc), 804)
+        self.assertEqual((nombres[0], funcionalidades[0]), ("TUP1", "TUP1"))
+        self.assertAlmostEqual(contenidos_gc[0], 48.51, places=2)
+        self.assertEqual(funcionalidades[nombres.index("SOD2")], "Superoxide dismutase [Mn], mitochondrial")
+        self.assertEqual(funcionalidades[nombres.index("ETR1")],
+                         "Enoyl-[acyl-carrier-protein] reductase 1, mitochondrial")
+
+    def test_genoma_completo(self):
+        nombres, contenidos_gc, funcionalidades = self._parsear_muestra("test_genoma completo.fasta")
+        self.assertEqual(nombres, ["Aspergillus niger"])
+        self.assertEqual(funcionalidades, ["genoma completo"])
+        self.assertAlmostEqual(contenidos_gc[0], 49.42, places=2)
+
+    def test_archivo_vacio(self):
+        self.assertEqual(self._parsear_bytes(b""), ([], array("d"), []))
+
+    def test_crlf(self):
+        nombres, contenidos_gc, _ = self._parsear_bytes(b">a Homo sapiens x\r\nACGT\r\nGGCC\r\n>b Mus musculus\r\nAAAA\r\n")
+        self.assertEqual(nombres, ["Homo sapiens", "Mus musculus"])
+        self.assertEqual(list(contenidos_gc), [75.0, 0.0])
+
+    def test_solo_cr(self):
+        nombres, contenidos_gc, _ = self._parsear_bytes(b">a Homo sapiens x\rACGT\rGGCC\r>b Mus musculus y\rAAAA\r")
+        self.assertEqual(nombres, ["Homo sapiens", "Mus musculus"])
+        self.assertEqual(list(contenidos_gc), [75.0, 0.0])
+
+    def test_encabezado_latin1(self):
+        nombres, contenidos_gc, _ = self._parsear_bytes(b">org Caf\xe9 b\nGGCA\n>otro Mus musculus\nAT\n")
+        self.assertEqual(nombres, ["Caf\ufffd b", "Mus musculus"])
+        self.assertEqual(list(contenidos_gc), [75.0, 0.0])
+
+    def test_texto_antes_del_primer_encabezado(self):
+        nombres, contenidos_gc, _ = self._parsear_bytes(b"comentario\nGGGG\n>a Homo sapiens\nACGT\n")
+        self.assertEqual(nombres, ["Homo sapiens"])
+        self.assertEqual(list(contenidos_gc), [50.0])
+
+    def test_formato_del_primer_encabezado(self):
+        nombres, _, funcionalidades = self._parsear_bytes(b">a [gene=X] [protein=P]\nGC\n>b Homo sapiens\nAT\n")
+        self.assertEqual(nombres, ["X", "Desconocido"])
+        self.assertEqual(funcionalidades, ["P", "Desconocida"])
+
+    def test_bloques_pequenos(self):
+        contenidos = [
+            b">a Homo sapiens x\r\nACGT\r\nGGCC\r\n>b Mus musculus\r\nAAAA\r\n",
+            b">a Homo sapiens x\rACGT\rGGCC\r>b Mus musculus y\rAAAA\r",
+            b"comentario\nGGGG\n>a [gene=X] [protein=P [Q], R]\nGCGCAT\nTT\n>b [locus_tag=L]\n\n",
+        ]
+        esperado_archivos = [self._parsear_muestra(nombre) for nombre in self.ARCHIVOS]
+        esperado_contenidos = [self._parsear_bytes(contenido) for contenido in contenidos]
+        bloque_original = sa._BLOQUE
+        try:
+            for bloque in (1, 7):
+                sa._BLOQUE = bloque
+                for nombre, esperado in zip(self.ARCHIVOS, esperado_archivos):
+                    self.assertEqual(self._parsear_muestra(nombre), esperado)
+                for contenido, esperado in zip(contenidos, esperado_contenidos):
+                    self.assertEqual(self._parsear_bytes(contenido), esperado)
+        finally:
+            sa._BLOQUE = bloque_original
+
+    def test_grupo_de_procesos_roto(self):
+        class GrupoRoto:
+            cerrado = False
+
+            def submit(self, funcion, *args):
+                futuro = Future()
+                futuro.set_exception(BrokenProcessPool("un proceso terminó de forma inesperada"))
+                return futuro
+
+            def shutdown(self, wait=True):
+                self.cerrado = True
+
+        contenido = b"".join(b">s%d Homo sapiens\nGGCCAT\nAT\n" % i for i in range(50))
+        esperado = self._parsear_bytes(contenido)
+        grupo = GrupoRoto()
+        originales = sa._POOL, sa._UMBRAL_PARALELO, sa._TAMANO_LOTE, sa._num_cpus
+        sa._POOL, sa._UMBRAL_PARALELO, sa._TAMANO_LOTE, sa._num_cpus = grupo, 0, 16, lambda: 2
+        try:
+            self.assertEqual(self._parsear_bytes(contenido), esperado)
+            self.assertIsNone(sa._POOL)
+            self.assertTrue(grupo.cerrado)
+        finally:
+            sa._POOL, sa._UMBRAL_PARALELO, sa._TAMANO_LOTE, sa._num_cpus = originales
+
+
+class EncabezadoGenTest(unittest.TestCase):
+
+    def test_gene_tiene_prioridad_sobre_locus_tag(self):
+        self.assertEqual(sa._procesar_encabezado_gen(">x [locus_tag=L1] [gene=G1] [protein=P]"), ("G1", "P"))
+
+    def test_solo_locus_tag(self):
+        self.assertEqual(sa._procesar_encabezado_gen(">x [locus_tag=L1] [protein=P]"), ("L1", "P"))
+
+    def test_sin_gene_ni_locus_tag(self):
+        self.assertEqual(sa._procesar_encabezado_gen(">x [protein=P]"), ("Desconocido", "P"))
+
+    def test_sin_protein(self):
+        self.assertEqual(sa._procesar_encabezado_gen(">x [gene=G1] [locus_tag=L1]"), ("G1", "Desconocida"))
+
+    def test_corchetes_anidados(self):
+        linea = ">x [gene=SOD2] [protein=Superoxide dismutase [Mn], mitochondrial] [protein_id=NP_1.1]"
+        self.assertEqual(sa._procesar_encabezado_gen(linea), ("SOD2", "Superoxide dismutase [Mn], mitochondrial"))
+
+
+class CalcularGcTest(unittest.TestCase):
+
+    SECUENCIAS = [b"GGCC", b"", b"ATAT", b"gcSsNNat", b"ACGTN" * 5000]
+
+    def _esperado(self, secuencia):
+        if not secuencia:
+            return 0
+        return 100.0 * sum(secuencia.count(base) for base in b"GCSgcs") / len(secuencia)
+
+    def _comprobar(self):
+        for secuencia in self.SECUENCIAS:
+            if secuencia:
+                self.assertAlmostEqual(sa.calcular_gc(secuencia), self._esperado(secuencia))
+        esperado = [self._esperado(secuencia) for secuencia in self.SECUENCIAS]
+        for obtenido, valor in zip(sa.calcular_gc_lote(self.SECUENCIAS), esperado):
+            self.assertAlmostEqual(obtenido, valor)
+
+    def test_biblioteca_estandar(self):
+        contar_gc_numba = sa._contar_gc_numba
+        sa._contar_gc_numba = None
+        try:
+            self._comprobar()
+        finally:
+            sa._contar_gc_numba = contar_gc_numba
+
+    @unittest.skipIf(sa._contar_gc_numba is None, "Numba no está instalado")
+    def test_numba(self):
+        self._comprobar()
+
+    @unittest.skipIf(sa._contar_gc_numba is None, "Numba no está instalado")
+    def test_numba_igual_que_biblioteca_estandar(self):
+        secuencia = bytes(range(256)) * 100
+        con_numba = sa.calcular_gc(secuencia)
+        contar_gc_numba = sa._contar_gc_numba
+        sa._contar_gc_numba = None
+        try:
+            self.assertEqual(sa.calcular_gc(secuencia), con_numba)
+        finally:
+            sa._contar_gc_numba = contar_gc_numba
+
+
+class ComposicionBasesTest(unittest.TestCase):
+
+    def test_cuenta_mayusculas_y_minusculas(self):
+        self.assertEqual(sa.composicion_bases("ACGTacgtNNS"), {"A": 2, "C": 2, "G": 2, "T": 2})
+
+    def test_secuencia_vacia(self):
+        self.assertEqual(sa.composicion_bases(b""), {"A": 0, "C": 0, "G": 0, "T": 0})
+
+    def test_varios_bloques(self):
+        secuencia = b"AACGTTTgn" * 1000
+        esperado = {base: secuencia.upper().count(base.encode()) for base in "ACGT"}
+        bloque_original = sa._BLOQUE
+        try:
+            for bloque in (1, 7, 4096):
+                sa._BLOQUE = bloque
+                self.assertEqual(sa.composicion_bases(secuencia), esperado)
+        finally:
+            sa._BLOQUE = bloque_original
+
+
+if __name__ == "__main__":
+    unittest.main()